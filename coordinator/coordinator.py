@@ -7,6 +7,7 @@ import socket
 import subprocess
 import sys
 import threading
+import time
 import argparse
 
 from aiohttp import web
@@ -21,6 +22,7 @@ from star import Model
 
 _debug = False
 _use_coder = False
+_prelaunch = True
 _brainport = None
 _model = Model()
 _config = DataSync("config")
@@ -34,6 +36,10 @@ class SimulinkSimulation(Simulator):
         Simulator.__init__(self, brainObj, name)
         self.episode_started = False
         self.sim_sent_term = False
+        self.simulink = None
+        self.prelaunched = False
+        self.terminal_time = None
+        self.handoff_time = None
         if not _use_coder:
             self._simulink_invoke()
         logging.debug("SimulinkSimulation.__init__ finished")
@@ -41,6 +47,14 @@ class SimulinkSimulation(Simulator):
     def episode_start(self, parameters=None):
         global _model, _config, _action, _state
         global _use_coder
+
+        start_time = time.monotonic()
+        terminal_time = self.terminal_time
+        if self.handoff_time is not None:
+            logging.info("brain turnaround %.3f sec" % (
+                start_time - self.handoff_time,))
+        self.terminal_time = None
+        self.handoff_time = None
         
         if self.episode_started:
             # Were we terminated by the sim or the brain?
@@ -55,8 +69,10 @@ class SimulinkSimulation(Simulator):
             # Generate an episode_stop since sdk2 doesn't do it.
             self.episode_stop()
 
-        if _use_coder:
+        prelaunched = self.prelaunched
+        if _use_coder and not prelaunched:
             self._simulink_execute()
+        self.prelaunched = False
             
         self.episode_started = True
         self.sim_sent_term = False
@@ -84,6 +100,15 @@ class SimulinkSimulation(Simulator):
         # The terminal and reward are ignored on the initial state
 
         _model.format_start()
+
+        first_state_time = time.monotonic()
+        mode = "prelaunched" if prelaunched else "serial"
+        logging.info("episode gap %.3f sec (%s)" % (
+            first_state_time - start_time, mode))
+        if terminal_time is not None:
+            # End to end, from the terminal state to this first state.
+            logging.info("reset %.3f sec (%s)" % (
+                first_state_time - terminal_time, mode))
         
         return state
         
@@ -113,9 +138,24 @@ class SimulinkSimulation(Simulator):
         
         _model.format_step()
 
+        if terminal:
+            self.terminal_time = time.monotonic()
+
         if _use_coder and terminal:
             # terminal is True, simulator will exit, wait for it
             self.simulink.wait()
+            if _prelaunch:
+                # Launch the next simulator now so its startup
+                # overlaps with the brain starting the next episode.
+                # Its getconfig blocks the HTTP event loop in
+                # _config.wait() until episode_start posts the config
+                # or _simulink_cleanup stops it, so only one simulator
+                # can be prelaunched and cleanup must stop _config.
+                self._simulink_execute()
+                self.prelaunched = True
+
+        if terminal:
+            self.handoff_time = time.monotonic()
         
         return state, reward, terminal
 
@@ -154,9 +194,23 @@ class SimulinkSimulation(Simulator):
             "set_param(bdroot, 'SimulationCommand', 'start')", nargout=0)
         
     def _simulink_stop(self):
-        """Start the standard (non-coder) simulation. (Non Simulink Coder)"""
+        """Stop the standard (non-coder) simulation. (Non Simulink Coder)"""
         self.eng.eval(
             "set_param(bdroot, 'SimulationCommand', 'stop')", nargout=0)
+
+    def _simulink_cleanup(self):
+        """Terminate a prelaunched simulator no episode will use. (Simulink Coder)"""
+        global _config
+
+        if not self.prelaunched:
+            return
+        logging.debug("terminating prelaunched simulator")
+        self.prelaunched = False
+        if self.simulink.poll() is None:
+            self.simulink.terminate()
+            self.simulink.wait()
+        # Release a getconfig handler blocked on the config.
+        _config.stop()
         
 async def _handle_request(request):
     global _model, _config, _action, _state
@@ -221,8 +275,11 @@ def _run_bonsai(args):
 
     sim = SimulinkSimulation(brain, "simulink_sim")
     logging.info('%s running' % brain.name)
-    while sim.run():
-        continue
+    try:
+        while sim.run():
+            continue
+    finally:
+        sim._simulink_cleanup()
         
     logging.info('%s finished' % brain.name)
     
@@ -245,8 +302,10 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser()
     parser.add_argument('--coder', action='store_true')
+    parser.add_argument('--no-prelaunch', action='store_true')
     (opts, unknown_args) = parser.parse_known_args(sys.argv)
     _use_coder = opts.coder
+    _prelaunch = not opts.no_prelaunch
 
     # If we aren't using coder, import the matlab engine
     if not _use_coder: